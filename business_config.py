@@ -3,6 +3,7 @@ Business Configuration for Cyber Insurance Underwriting
 Centralizes all business rules, thresholds, and settings
 """
 
+from bisect import bisect_right
 from typing import Dict, List, Any
 from enum import Enum
 
@@ -149,6 +150,9 @@ class BusinessConfig:
         "medium": 0.6,
         "high": 0.8
     }
+    # Scores at or above each bound move up one priority level
+    PRIORITY_BOUNDS = (PRIORITY_THRESHOLDS["medium"], PRIORITY_THRESHOLDS["high"])
+    PRIORITY_LEVELS = ("low", "medium", "high")
     
     # Message templates
     MESSAGE_TEMPLATES = {
@@ -272,12 +276,7 @@ Underwriting Team
     @classmethod
     def calculate_risk_priority(cls, risk_score: float) -> str:
         """Calculate priority based on risk score"""
-        if risk_score >= cls.PRIORITY_THRESHOLDS["high"]:
-            return "high"
-        elif risk_score >= cls.PRIORITY_THRESHOLDS["medium"]:
-            return "medium"
-        else:
-            return "low"
+        return cls.PRIORITY_LEVELS[bisect_right(cls.PRIORITY_BOUNDS, risk_score)]
     
     @classmethod
     def get_message_template(cls, template_name: str) -> Dict[str, str]:
@@ -5,6 +5,7 @@ Handles submission validation, appetite filtering, and assignment logic
 
 from typing import Dict, List, Optional, Tuple
 import logging
+from functools import lru_cache
 from datetime import datetime
 import re
 import random
@@ -12,6 +13,9 @@ from business_config import BusinessConfig
 
 logger = logging.getLogger(__name__)
 
+# Strips everything but digits and the decimal point from amount strings
+_NON_NUMERIC_RE = re.compile(r'[^0-9.]')
+
 class CyberInsuranceValidator:
     """Enhanced validator for cyber insurance submissions with business rules"""
     
@@ -37,6 +41,14 @@ class CyberInsuranceValidator:
         "Cyber",  # Capitalized version
         "CYBER"   # All caps version
     ]
+    ACCEPTED_POLICY_TYPE_SET = frozenset(ACCEPTED_POLICY_TYPES)
+    
+    # Underwriter level for each industry; the first level listing an industry wins
+    UNDERWRITER_LEVEL_BY_INDUSTRY = {
+        industry: level
+        for level, criteria in reversed(list(BusinessConfig.UNDERWRITER_ASSIGNMENTS.items()))
+        for industry in criteria["industries"]
+    }
     
     # Use centralized business configuration
     @classmethod
@@ -75,7 +87,7 @@ class CyberInsuranceValidator:
         # Validate policy type appetite - handle both string and integer inputs
         policy_type_raw = extracted_fields.get("policy_type", "")
         policy_type = str(policy_type_raw).strip() if policy_type_raw else ""
-        if policy_type not in cls.ACCEPTED_POLICY_TYPES:
+        if policy_type not in cls.ACCEPTED_POLICY_TYPE_SET:
             return "Rejected", [], f"Policy type '{policy_type}' is outside our cyber insurance appetite. Accepted types: {', '.join(cls.ACCEPTED_POLICY_TYPES)}"
         
         # Industry-specific validation - handle both string and integer inputs
@@ -118,9 +130,10 @@ class CyberInsuranceValidator:
         coverage_amount = cls._parse_coverage_amount(extracted_fields.get("coverage_amount", ""))
         
         # Determine underwriter level based on industry and coverage
-        for level, criteria in BusinessConfig.UNDERWRITER_ASSIGNMENTS.items():
-            if (industry in criteria["industries"] and 
-                coverage_amount is not None and coverage_amount >= criteria["min_coverage"]):
+        level = cls.UNDERWRITER_LEVEL_BY_INDUSTRY.get(industry)
+        if level is not None:
+            criteria = BusinessConfig.UNDERWRITER_ASSIGNMENTS[level]
+            if coverage_amount is not None and coverage_amount >= criteria["min_coverage"]:
                 
                 # Get available underwriters for this level
                 available = BusinessConfig.get_available_underwriters(level.split("_")[0])  # senior, standard, junior
@@ -151,6 +164,28 @@ class CyberInsuranceValidator:
         """
         Generate initial risk category scores based on submission data
         """
+        # Scores depend only on these three fields; intake scores each submission twice
+        # (once via calculate_risk_priority), so repeat calls come from the cache
+        industry = extracted_fields.get("industry", "")
+        data_types_raw = extracted_fields.get("data_types", "")
+        security_measures_raw = extracted_fields.get("security_measures", "")
+        try:
+            return dict(cls._cached_risk_categories(industry, data_types_raw, security_measures_raw))
+        except TypeError:
+            # Unhashable field values (e.g. lists) can't be cache keys
+            return cls._score_risk_categories(industry, data_types_raw, security_measures_raw)
+    
+    @staticmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _cached_risk_categories(industry, data_types_raw, security_measures_raw) -> Tuple[Tuple[str, float], ...]:
+        """Memoized risk scores as an immutable tuple of (category, score) pairs"""
+        return tuple(CyberInsuranceValidator._score_risk_categories(
+            industry, data_types_raw, security_measures_raw
+        ).items())
+    
+    @staticmethod
+    def _score_risk_categories(industry, data_types_raw, security_measures_raw) -> Dict[str, float]:
+        """Score the risk categories from the fields that drive them"""
         categories = {
             "technical": 50.0,
             "operational": 50.0,
@@ -158,8 +193,6 @@ class CyberInsuranceValidator:
             "compliance": 50.0
         }
         
-        industry = extracted_fields.get("industry", "")
-        
         # Industry-specific risk adjustments
         if industry == "Healthcare":
             categories["compliance"] += 20  # HIPAA requirements
@@ -172,7 +205,6 @@ class CyberInsuranceValidator:
             categories["operational"] += 10
         
         # Data type risk adjustments - handle both string and integer inputs
-        data_types_raw = extracted_fields.get("data_types", "")
         data_types = str(data_types_raw).lower() if data_types_raw else ""
         if "pii" in data_types or "personal" in data_types:
             categories["compliance"] += 15
@@ -182,7 +214,6 @@ class CyberInsuranceValidator:
             categories["compliance"] += 25
         
         # Security measures adjustments - handle both string and integer inputs
-        security_measures_raw = extracted_fields.get("security_measures", "")
         security_measures = str(security_measures_raw).lower() if security_measures_raw else ""
         if any(measure in security_measures for measure in ["mfa", "encryption", "firewall"]):
             categories["technical"] -= 10  # Reduce risk for good security
@@ -212,17 +243,17 @@ class CyberInsuranceValidator:
             
             # Handle millions notation
             if "M" in clean_str.upper() or "million" in clean_str.lower():
-                number_part = re.sub(r'[^0-9.]', '', clean_str.upper().replace("M", "").replace("MILLION", ""))
+                number_part = _NON_NUMERIC_RE.sub('', clean_str.upper().replace("M", "").replace("MILLION", ""))
                 return float(number_part) * 1_000_000
             
             # Handle thousands notation  
             if "K" in clean_str.upper() or "thousand" in clean_str.lower():
-                number_part = re.sub(r'[^0-9.]', '', clean_str.upper().replace("K", "").replace("THOUSAND", ""))
+                number_part = _NON_NUMERIC_RE.sub('', clean_str.upper().replace("K", "").replace("THOUSAND", ""))
                 return float(number_part) * 1_000
             
             # Handle billions notation
             if "B" in clean_str.upper() or "billion" in clean_str.lower():
-                number_part = re.sub(r'[^0-9.]', '', clean_str.upper().replace("B", "").replace("BILLION", ""))
+                number_part = _NON_NUMERIC_RE.sub('', clean_str.upper().replace("B", "").replace("BILLION", ""))
                 return float(number_part) * 1_000_000_000
             
             return float(clean_str)
@@ -6,6 +6,7 @@ Check database for recent submissions and their extracted data
 from database import SessionLocal, Submission, WorkItem
 from sqlalchemy import desc
 import json
+import sys
 
 def check_recent_submissions():
     """Check recent submissions in the database"""
@@ -43,8 +44,8 @@ def check_recent_submissions():
             if sub.extracted_fields:
                 print(f"\nExtracted Fields:")
                 if isinstance(sub.extracted_fields, dict):
-                    for key, value in sub.extracted_fields.items():
-                        print(f"  {key}: {value}")
+                    # One write for the whole field list instead of a print per field
+                    sys.stdout.write("".join(f"  {key}: {value}\n" for key, value in sub.extracted_fields.items()))
                 else:
                     print(f"  Raw: {sub.extracted_fields}")
             else:
@@ -7,27 +7,22 @@ import logging
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, case, text
+from sqlalchemy import func, and_, or_
 from collections import defaultdict
+from bisect import bisect_left
 import statistics
 
 from database import (
-    WorkItem, User, RiskAssessment, Submission, WorkItemHistory, 
-    Comment, WorkItemStatus, WorkItemPriority, CompanySize
+    WorkItem, User, Submission, Comment, WorkItemStatus, WorkItemPriority
 )
 from dashboard_models import (
     DashboardKPIs, KPIMetric, MetricTrend, WorkQueueSummary, TeamMetrics,
     RiskDistribution, IndustryRiskMetrics, CoverageTypeMetrics, PortfolioSummary,
     ProcessingMetrics, UnderwriterDashboard, ComprehensiveRiskAssessment,
-    RiskFactorDetail, AutomatedRecommendation, AssignmentRecommendation,
-    UnderwriterWorkload, DashboardTimeframe, AnalyticsTimeSeries,
-    AnalyticsTimeSeriesPoint, BenchmarkComparison, PortfolioAnalyticsReport,
-    CompanyProfile, CybersecurityPosture, FinancialHealth, PolicyDetails,
-    CoverageLimits, CoverageComponents, QuoteInformation, PricingFactors,
-    CompetitiveAnalysis
+    RiskFactorDetail, AutomatedRecommendation, DashboardTimeframe
 )
 from models import (
-    WorkItemSummary, UserDetail, WorkItemStatusEnum, WorkItemPriorityEnum,
+    WorkItemSummary, WorkItemStatusEnum, WorkItemPriorityEnum,
     CompanySizeEnum, UserRoleEnum
 )
 from business_rules import CyberInsuranceValidator
@@ -607,6 +602,68 @@ class DashboardService:
 class RiskScoringService:
     """Advanced risk scoring and assessment service"""
     
+    # Mock industry benchmark risk scores
+    INDUSTRY_BENCHMARKS = {
+        "Healthcare": 65.0,
+        "Financial Services": 70.0,
+        "Technology": 55.0,
+        "Manufacturing": 45.0,
+        "Retail": 50.0,
+        "Education": 40.0
+    }
+    
+    # Static risk factors, built once and copied per assessment
+    RISK_FACTOR_TEMPLATES = {
+        "hipaa": RiskFactorDetail(
+            category="compliance",
+            factor="HIPAA Compliance Requirements",
+            impact_level="High",
+            score_impact=15,
+            description="Healthcare industry requires strict HIPAA compliance",
+            mitigation_recommendation="Implement HIPAA-compliant security controls"
+        ),
+        "financial_regulations": RiskFactorDetail(
+            category="compliance",
+            factor="Financial Regulations",
+            impact_level="High",
+            score_impact=20,
+            description="Financial services subject to extensive regulations",
+            mitigation_recommendation="Ensure SOX, PCI-DSS compliance"
+        ),
+        "personal_information": RiskFactorDetail(
+            category="compliance",
+            factor="Personal Information Handling",
+            impact_level="Medium",
+            score_impact=10,
+            description="Handling of personally identifiable information",
+            mitigation_recommendation="Implement data classification and protection"
+        ),
+        "large_organization": RiskFactorDetail(
+            category="operational",
+            factor="Large Organization Complexity",
+            impact_level="Medium",
+            score_impact=12,
+            description="Large organizations have complex attack surfaces",
+            mitigation_recommendation="Implement enterprise security controls"
+        ),
+        "mfa": RiskFactorDetail(
+            category="technical",
+            factor="Multi-Factor Authentication",
+            impact_level="Low",
+            score_impact=-10,
+            description="MFA implementation reduces authentication risks",
+            mitigation_recommendation="Maintain and expand MFA coverage"
+        )
+    }
+    
+    # Inclusive upper bounds for each risk level; anything above is Critical
+    RISK_LEVEL_THRESHOLDS = (30, 60, 85)
+    RISK_LEVELS = ("Low", "Medium", "High", "Critical")
+    
+    # Fields whose presence raises confidence in an assessment
+    CONFIDENCE_FIELDS = ("industry", "company_size", "employee_count", "revenue", "data_types")
+    CONFIDENCE_PER_FIELD = 30 / len(CONFIDENCE_FIELDS)
+    
     def __init__(self, db: Session):
         self.db = db
     
@@ -654,80 +711,39 @@ class RiskScoringService:
         """Identify specific risk factors and their impacts"""
         
         factors = []
+        templates = self.RISK_FACTOR_TEMPLATES
         
         # Industry-specific risks - handle both string and integer inputs
         industry_raw = extracted_fields.get("industry", "")
         industry = str(industry_raw).lower() if industry_raw else ""
         if "healthcare" in industry:
-            factors.append(RiskFactorDetail(
-                category="compliance",
-                factor="HIPAA Compliance Requirements",
-                impact_level="High",
-                score_impact=15,
-                description="Healthcare industry requires strict HIPAA compliance",
-                mitigation_recommendation="Implement HIPAA-compliant security controls"
-            ))
+            factors.append(templates["hipaa"].model_copy())
         
         if "financial" in industry:
-            factors.append(RiskFactorDetail(
-                category="compliance",
-                factor="Financial Regulations",
-                impact_level="High",
-                score_impact=20,
-                description="Financial services subject to extensive regulations",
-                mitigation_recommendation="Ensure SOX, PCI-DSS compliance"
-            ))
+            factors.append(templates["financial_regulations"].model_copy())
         
         # Data type risks - handle both string and integer inputs
         data_types_raw = extracted_fields.get("data_types", "")
         data_types = str(data_types_raw).lower() if data_types_raw else ""
         if "pii" in data_types or "personal" in data_types:
-            factors.append(RiskFactorDetail(
-                category="compliance",
-                factor="Personal Information Handling",
-                impact_level="Medium",
-                score_impact=10,
-                description="Handling of personally identifiable information",
-                mitigation_recommendation="Implement data classification and protection"
-            ))
+            factors.append(templates["personal_information"].model_copy())
         
         # Company size risks
         employee_count = self._parse_employee_count(extracted_fields.get("employee_count"))
         if employee_count and employee_count > 1000:
-            factors.append(RiskFactorDetail(
-                category="operational",
-                factor="Large Organization Complexity",
-                impact_level="Medium",
-                score_impact=12,
-                description="Large organizations have complex attack surfaces",
-                mitigation_recommendation="Implement enterprise security controls"
-            ))
+            factors.append(templates["large_organization"].model_copy())
         
         # Security measures (positive factors) - handle both string and integer inputs
         security_measures_raw = extracted_fields.get("security_measures", "")
         security_measures = str(security_measures_raw).lower() if security_measures_raw else ""
         if "mfa" in security_measures:
-            factors.append(RiskFactorDetail(
-                category="technical",
-                factor="Multi-Factor Authentication",
-                impact_level="Low",
-                score_impact=-10,
-                description="MFA implementation reduces authentication risks",
-                mitigation_recommendation="Maintain and expand MFA coverage"
-            ))
+            factors.append(templates["mfa"].model_copy())
         
         return factors
     
     def _determine_risk_level(self, overall_score: float) -> str:
         """Determine risk level based on overall score"""
-        if overall_score <= 30:
-            return "Low"
-        elif overall_score <= 60:
-            return "Medium"
-        elif overall_score <= 85:
-            return "High"
-        else:
-            return "Critical"
+        return self.RISK_LEVELS[bisect_left(self.RISK_LEVEL_THRESHOLDS, overall_score)]
     
     def _calculate_confidence_score(self, extracted_fields: Dict[str, Any]) -> float:
         """Calculate confidence in the risk assessment"""
@@ -736,10 +752,9 @@ class RiskScoringService:
         confidence = 50.0
         
         # Increase confidence based on available data
-        required_fields = ["industry", "company_size", "employee_count", "revenue", "data_types"]
-        available_fields = sum(1 for field in required_fields if extracted_fields.get(field))
+        available_fields = sum(1 for field in self.CONFIDENCE_FIELDS if extracted_fields.get(field))
         
-        confidence += (available_fields / len(required_fields)) * 30
+        confidence += available_fields * self.CONFIDENCE_PER_FIELD
         
         # Additional confidence factors
         if extracted_fields.get("security_measures"):
@@ -751,18 +766,7 @@ class RiskScoringService:
     
     def _get_industry_benchmark(self, industry: str) -> Optional[float]:
         """Get industry benchmark risk score"""
-        
-        # Mock industry benchmarks
-        benchmarks = {
-            "Healthcare": 65.0,
-            "Financial Services": 70.0,
-            "Technology": 55.0,
-            "Manufacturing": 45.0,
-            "Retail": 50.0,
-            "Education": 40.0
-        }
-        
-        return benchmarks.get(industry, 50.0)
+        return self.INDUSTRY_BENCHMARKS.get(industry, 50.0)
     
     def _parse_employee_count(self, employee_str: str) -> Optional[int]:
         """Parse employee count from string"""
@@ -770,6 +774,10 @@ class RiskScoringService:
             return None
         
         try:
+            # LLM extraction often yields a number already; skip the string round-trip
+            if isinstance(employee_str, (int, float)):
+                return int(employee_str)
+            
             # Remove common formatting
             clean_str = str(employee_str).replace(",", "").replace(" ", "")
             
@@ -786,6 +794,13 @@ class RiskScoringService:
 class RecommendationService:
     """Service for generating automated recommendations"""
     
+    # Industries that always trigger a senior referral (matched case-insensitively)
+    HIGH_RISK_INDUSTRIES = ("cryptocurrency", "cannabis", "gaming")
+    
+    # Premium risk multipliers by inclusive risk score upper bound
+    PREMIUM_RISK_THRESHOLDS = (40, 70)
+    PREMIUM_RISK_MULTIPLIERS = (0.8, 1.0, 1.5)
+    
     def __init__(self, db: Session):
         self.db = db
     
@@ -916,8 +931,8 @@ class RecommendationService:
         
         # High-risk industries
         industry = extracted_fields.get("industry", "")
-        high_risk_industries = ["Cryptocurrency", "Cannabis", "Gaming"]
-        if any(risk_industry.lower() in industry.lower() for risk_industry in high_risk_industries):
+        industry_lower = str(industry).lower() if industry else ""
+        if any(risk_industry in industry_lower for risk_industry in self.HIGH_RISK_INDUSTRIES):
             triggers.append(f"High-risk industry: {industry}")
         
         return triggers if triggers else None
@@ -937,12 +952,9 @@ class RecommendationService:
         base_rate = 0.02  # 2% of coverage
         
         # Risk adjustment
-        if risk_score <= 40:
-            risk_multiplier = 0.8
-        elif risk_score <= 70:
-            risk_multiplier = 1.0
-        else:
-            risk_multiplier = 1.5
+        risk_multiplier = self.PREMIUM_RISK_MULTIPLIERS[
+            bisect_left(self.PREMIUM_RISK_THRESHOLDS, risk_score)
+        ]
         
         # Industry adjustment
         industry_multiplier = BusinessConfig.get_industry_risk_multiplier(
@@ -1,46 +1,82 @@
+import atexit
 import base64
+import hashlib
 import os
 import io
 import logging
-from typing import List, Dict, Any
-import pdfplumber
-import fitz  # PyMuPDF
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
-# Optional imports for file types we may not support in production
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# Parser libraries are imported on first use, not at module load: pandas alone adds
+# hundreds of milliseconds to a serverless cold start. find_spec only checks presence.
+def _module_available(name: str) -> bool:
+    return find_spec(name) is not None
+
+# PDF support is required; main.py falls back to file_parsers_minimal on ImportError
+for _required in ("fitz", "pdfplumber"):
+    if not _module_available(_required):
+        raise ImportError(f"Required PDF parser module '{_required}' is not installed")
+
+# Optional parsers for file types we may not support in production
+DOCX_AVAILABLE = _module_available("docx")
+if not DOCX_AVAILABLE:
     logger.warning("python-docx not available - Word document parsing disabled")
 
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
+PANDAS_AVAILABLE = _module_available("pandas")
+if not PANDAS_AVAILABLE:
     logger.warning("pandas not available - Excel parsing disabled")
 
-try:
-    import pytesseract
-    from PIL import Image
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
+# In-process ONNX OCR when installed; otherwise pytesseract, which spawns tesseract per page
+RAPIDOCR_AVAILABLE = _module_available("rapidocr_onnxruntime")
+OCR_AVAILABLE = _module_available("PIL") and (RAPIDOCR_AVAILABLE or _module_available("pytesseract"))
+if not OCR_AVAILABLE:
     logger.warning("pytesseract/PIL not available - OCR parsing disabled")
 
-try:
-    import openpyxl
-    EXCEL_AVAILABLE = True
-except ImportError:
-    EXCEL_AVAILABLE = False
+EXCEL_AVAILABLE = _module_available("openpyxl")
+if not EXCEL_AVAILABLE:
     logger.warning("openpyxl not available - Excel parsing disabled")
 
+# Rust-backed pandas Excel engine when installed, else pandas default (openpyxl for .xlsx)
+EXCEL_ENGINE = "calamine" if _module_available("python_calamine") else None
+
+# Submission scans are mostly uniform text blocks: skip page layout analysis (PSM 6),
+# run the LSTM engine only and skip tesseract's inverted-image retry pass
+OCR_CONFIG = "--psm 6 --oem 1 -c tessedit_do_invert=0"
+
+# Shortest base64 payload worth decoding: 16 chars is 12 bytes, below any supported file
+MIN_BASE64_LENGTH = 16
+
+
+@lru_cache(maxsize=1)
+def _rapidocr_engine():
+    """Load the RapidOCR models once per process and reuse them across images"""
+    from rapidocr_onnxruntime import RapidOCR
+    return RapidOCR()
+
 
 class FileParser:
-    """Base class for file parsing operations"""
+    """Base class for file parsing operations
+    
+    The parse_* methods accept either a path on disk or the raw file bytes.
+    """
+    
+    @staticmethod
+    def _open_source(source: Union[str, bytes]):
+        """Return something the parser libraries can open: the path or a BytesIO"""
+        return io.BytesIO(source) if isinstance(source, bytes) else source
+    
+    @staticmethod
+    def _source_name(source: Union[str, bytes]) -> str:
+        """Describe a parse source for log and status messages"""
+        return source if isinstance(source, str) else "<in-memory file>"
     
     @staticmethod
     def decode_base64_file(content_base64: str, filename: str, upload_dir: str) -> str:
@@ -69,60 +105,73 @@ class FileParser:
             raise
     
     @staticmethod
-    def parse_pdf(file_path: str) -> str:
-        """Extract text from PDF using pdfplumber"""
+    def parse_pdf(source: Union[str, bytes]) -> str:
+        """Extract text from PDF using PyMuPDF, falling back to pdfplumber"""
         try:
-            text_content = []
-            
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(page_text)
-            
-            combined_text = "\n".join(text_content)
-            logger.info(f"Successfully extracted text from PDF: {file_path}")
-            return combined_text
-            
+            combined_text = FileParser.parse_pdf_pymupdf(source)
         except Exception as e:
-            logger.error(f"Error parsing PDF {file_path}: {str(e)}")
-            # Fallback to PyMuPDF if pdfplumber fails
-            try:
-                return FileParser.parse_pdf_pymupdf(file_path)
-            except Exception as e2:
-                logger.error(f"Error parsing PDF with PyMuPDF {file_path}: {str(e2)}")
-                raise
+            logger.error(f"Error parsing PDF with PyMuPDF {FileParser._source_name(source)}: {str(e)}")
+            combined_text = ""
+        
+        # MuPDF is much faster; only pay for pdfplumber when it found no text
+        if combined_text.strip():
+            return combined_text
+        
+        return FileParser.parse_pdf_pdfplumber(source)
     
     @staticmethod
-    def parse_pdf_pymupdf(file_path: str) -> str:
-        """Extract text from PDF using PyMuPDF as fallback"""
+    def parse_pdf_pymupdf(source: Union[str, bytes]) -> str:
+        """Extract text from PDF using PyMuPDF"""
+        import fitz  # PyMuPDF
+        
+        if isinstance(source, bytes):
+            doc = fitz.open(stream=source, filetype="pdf")
+        else:
+            doc = fitz.open(source)
+        
+        # Plain unsorted text is enough here; the LLM reflows it anyway. Don't clip to
+        # the page box: generated PDFs can draw text past it, which pdfplumber keeps
+        clip = fitz.INFINITE_RECT()
+        with doc:
+            combined_text = "\n".join(
+                text for text in (page.get_text("text", sort=False, clip=clip) for page in doc) if text
+            )
+        
+        logger.info(f"Successfully extracted text from PDF using PyMuPDF: {FileParser._source_name(source)}")
+        return combined_text
+    
+    @staticmethod
+    def parse_pdf_pdfplumber(source: Union[str, bytes]) -> str:
+        """Extract text from PDF using pdfplumber as fallback"""
+        import pdfplumber
+        
         try:
             text_content = []
-            doc = fitz.open(file_path)
             
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                text = page.get_text()
-                if text:
-                    text_content.append(text)
+            with pdfplumber.open(FileParser._open_source(source)) as pdf:
+                for page in pdf.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        text_content.append(page_text)
             
-            doc.close()
             combined_text = "\n".join(text_content)
-            logger.info(f"Successfully extracted text from PDF using PyMuPDF: {file_path}")
+            logger.info(f"Successfully extracted text from PDF using pdfplumber: {FileParser._source_name(source)}")
             return combined_text
             
         except Exception as e:
-            logger.error(f"Error parsing PDF with PyMuPDF {file_path}: {str(e)}")
+            logger.error(f"Error parsing PDF with pdfplumber {FileParser._source_name(source)}: {str(e)}")
             raise
     
     @staticmethod
-    def parse_docx(file_path: str) -> str:
+    def parse_docx(source: Union[str, bytes]) -> str:
         """Extract text from DOCX file"""
         if not DOCX_AVAILABLE:
-            return f"Word document parsing not available: {os.path.basename(file_path)} (python-docx not installed)"
+            return f"Word document parsing not available: {os.path.basename(FileParser._source_name(source))} (python-docx not installed)"
+        
+        from docx import Document
         
         try:
-            doc = Document(file_path)
+            doc = Document(FileParser._open_source(source))
             text_content = []
             
             for paragraph in doc.paragraphs:
@@ -140,28 +189,35 @@ class FileParser:
                         text_content.append(" | ".join(row_text))
             
             combined_text = "\n".join(text_content)
-            logger.info(f"Successfully extracted text from DOCX: {file_path}")
+            logger.info(f"Successfully extracted text from DOCX: {FileParser._source_name(source)}")
             return combined_text
             
         except Exception as e:
-            logger.error(f"Error parsing DOCX {file_path}: {str(e)}")
+            logger.error(f"Error parsing DOCX {FileParser._source_name(source)}: {str(e)}")
             raise
     
     @staticmethod
-    def parse_xlsx(file_path: str) -> str:
+    def parse_xlsx(source: Union[str, bytes]) -> str:
         """Extract text from XLSX file"""
         if not PANDAS_AVAILABLE or not EXCEL_AVAILABLE:
-            return f"Excel parsing not available: {os.path.basename(file_path)} (pandas/openpyxl not installed)"
+            return f"Excel parsing not available: {os.path.basename(FileParser._source_name(source))} (pandas/openpyxl not installed)"
+        
+        import pandas as pd
         
         try:
             text_content = []
             
-            # Read all sheets
-            excel_file = pd.ExcelFile(file_path)
+            # Read all sheets, preferring the calamine engine when installed
+            try:
+                excel_file = pd.ExcelFile(FileParser._open_source(source), engine=EXCEL_ENGINE)
+            except (ImportError, ValueError):
+                # pandas < 2.2 does not know the calamine engine
+                excel_file = pd.ExcelFile(FileParser._open_source(source))
             
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-                
+            with excel_file:
+                sheets = excel_file.parse(sheet_name=None)  # every sheet in one pass
+            
+            for sheet_name, df in sheets.items():
                 # Add sheet name as header
                 text_content.append(f"Sheet: {sheet_name}")
                 
@@ -171,48 +227,95 @@ class FileParser:
                     df = df.fillna('')
                     
                     # Get column names
-                    columns = list(df.columns)
-                    text_content.append(" | ".join(str(col) for col in columns))
+                    text_content.append(" | ".join(map(str, df.columns)))
                     
-                    # Get row data
-                    for _, row in df.iterrows():
-                        row_data = [str(cell) for cell in row.values]
-                        text_content.append(" | ".join(row_data))
+                    # Get row data from plain tuples rather than per-row Series
+                    text_content.extend(
+                        " | ".join(map(str, row))
+                        for row in df.itertuples(index=False, name=None)
+                    )
                 
                 text_content.append("")  # Add spacing between sheets
             
             combined_text = "\n".join(text_content)
-            logger.info(f"Successfully extracted text from XLSX: {file_path}")
+            logger.info(f"Successfully extracted text from XLSX: {FileParser._source_name(source)}")
             return combined_text
             
         except Exception as e:
-            logger.error(f"Error parsing XLSX {file_path}: {str(e)}")
+            logger.error(f"Error parsing XLSX {FileParser._source_name(source)}: {str(e)}")
             raise
     
     @staticmethod
-    def parse_image(file_path: str) -> str:
+    def parse_image(source: Union[str, bytes]) -> str:
         """Extract text from image using OCR"""
         if not OCR_AVAILABLE:
-            return f"Image OCR not available: {os.path.basename(file_path)} (pytesseract/PIL not installed)"
+            return f"Image OCR not available: {os.path.basename(FileParser._source_name(source))} (pytesseract/PIL not installed)"
+        
+        from PIL import Image
         
         try:
             # Open image
-            image = Image.open(file_path)
+            image = Image.open(FileParser._open_source(source))
             
-            # Perform OCR
-            text = pytesseract.image_to_string(image)
+            # Perform OCR on every frame (multi-page TIFFs carry one page per frame)
+            page_texts = []
+            for frame in range(getattr(image, "n_frames", 1)):
+                image.seek(frame)
+                page_texts.append(FileParser._ocr_frame(image))
+            text = "\n".join(page_texts)
             
-            logger.info(f"Successfully extracted text from image using OCR: {file_path}")
+            logger.info(f"Successfully extracted text from image using OCR: {FileParser._source_name(source)}")
             return text
             
         except Exception as e:
-            logger.error(f"Error parsing image {file_path}: {str(e)}")
+            logger.error(f"Error parsing image {FileParser._source_name(source)}: {str(e)}")
             raise
     
+    @staticmethod
+    def _ocr_frame(image) -> str:
+        """OCR a single PIL image frame with the best available backend"""
+        if RAPIDOCR_AVAILABLE:
+            import numpy as np
+            
+            # RapidOCR follows the OpenCV convention of BGR pixel arrays
+            bgr = np.asarray(image.convert("RGB"))[:, :, ::-1]
+            result, _ = _rapidocr_engine()(bgr)
+            return "\n".join(line[1] for line in result or ())
+        
+        import pytesseract
+        return pytesseract.image_to_string(image, config=OCR_CONFIG)
+    
     @staticmethod
     def get_file_extension(filename: str) -> str:
         """Get file extension from filename"""
-        return os.path.splitext(filename)[1].lower()
+        # Same result as os.path.splitext, without its generic path handling
+        start = filename.rfind('/') + 1
+        dot = filename.rfind('.', start)
+        if dot < 0 or not filename[start:dot].lstrip('.'):
+            # No dot, or only leading dots (".pdf", "..pdf") - not an extension
+            return ''
+        return filename[dot:].lower()
+    
+    @staticmethod
+    def parse_source(source: Union[str, bytes], extension: str) -> str:
+        """Parse a file path or raw bytes based on extension"""
+        parser = _PARSERS_BY_EXTENSION.get(extension)
+        if parser is None:
+            logger.warning(f"Unsupported file type: {extension}")
+            return ""
+        return parser(source)
+    
+    @staticmethod
+    def parse_file_bytes(content_base64: str, filename: str) -> str:
+        """Decode base64 content and parse it in memory, without a temporary file"""
+        try:
+            if len(content_base64) < MIN_BASE64_LENGTH:
+                raise ValueError("empty content")
+            raw = base64.b64decode(content_base64)
+            return FileParser.parse_source(raw, FileParser.get_file_extension(filename))
+        except Exception as e:
+            logger.error(f"Error parsing file {filename}: {str(e)}")
+            raise
     
     @staticmethod
     def parse_file(content_base64: str, filename: str, upload_dir: str) -> str:
@@ -221,21 +324,8 @@ class FileParser:
             # Decode and save file
             file_path = FileParser.decode_base64_file(content_base64, filename, upload_dir)
             
-            # Get file extension
-            extension = FileParser.get_file_extension(filename)
-            
             # Parse based on file type
-            if extension == '.pdf':
-                return FileParser.parse_pdf(file_path)
-            elif extension == '.docx':
-                return FileParser.parse_docx(file_path)
-            elif extension in ['.xlsx', '.xls']:
-                return FileParser.parse_xlsx(file_path)
-            elif extension in ['.jpg', '.jpeg', '.png', '.tiff', '.bmp']:
-                return FileParser.parse_image(file_path)
-            else:
-                logger.warning(f"Unsupported file type: {extension}")
-                return ""
+            return FileParser.parse_source(file_path, FileParser.get_file_extension(filename))
                 
         except Exception as e:
             logger.error(f"Error parsing file {filename}: {str(e)}")
@@ -250,31 +340,184 @@ class FileParser:
                 logger.warning(f"Error cleaning up file {file_path}: {str(cleanup_error)}")
 
 
-def parse_attachments(attachments: List[Dict[str, Any]], upload_dir: str) -> str:
-    """Parse all attachments and return combined text"""
-    all_text = []
+# Parser for each supported file extension
+_PARSERS_BY_EXTENSION = {
+    '.pdf': FileParser.parse_pdf,
+    '.docx': FileParser.parse_docx,
+    '.xlsx': FileParser.parse_xlsx,
+    '.xls': FileParser.parse_xlsx,
+    '.jpg': FileParser.parse_image,
+    '.jpeg': FileParser.parse_image,
+    '.png': FileParser.parse_image,
+    '.tiff': FileParser.parse_image,
+    '.bmp': FileParser.parse_image,
+}
+
+
+# Extracted text keyed by attachment content, so re-sent files (reply threads, CCs) skip parsing.
+# Bounded by entry count and by total characters, since one large sheet can expand to tens of MB
+PARSED_TEXT_CACHE_SIZE = 256
+PARSED_TEXT_CACHE_MAX_CHARS = 64_000_000
+PARSED_TEXT_CACHE_MAX_ENTRY_CHARS = 8_000_000
+_parsed_text_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_parsed_text_cache_chars = 0
+_parsed_text_cache_lock = threading.Lock()
+
+
+def _attachment_cache_key(filename: str, content_base64: str) -> Tuple[str, str]:
+    """Content digest plus extension, since the extension selects the parser"""
+    digest = hashlib.blake2b(content_base64.encode(), digest_size=16).hexdigest()
+    return digest, FileParser.get_file_extension(filename)
+
+
+def _get_cached_text(key: Tuple[str, str]) -> Optional[str]:
+    with _parsed_text_cache_lock:
+        text = _parsed_text_cache.get(key)
+        if text is not None:
+            _parsed_text_cache.move_to_end(key)
+        return text
+
+
+def _store_cached_text(key: Tuple[str, str], text: str) -> None:
+    global _parsed_text_cache_chars
+    if len(text) > PARSED_TEXT_CACHE_MAX_ENTRY_CHARS:
+        return
+    with _parsed_text_cache_lock:
+        previous = _parsed_text_cache.pop(key, None)
+        if previous is not None:
+            _parsed_text_cache_chars -= len(previous)
+        _parsed_text_cache[key] = text
+        _parsed_text_cache_chars += len(text)
+        while (len(_parsed_text_cache) > PARSED_TEXT_CACHE_SIZE
+               or _parsed_text_cache_chars > PARSED_TEXT_CACHE_MAX_CHARS):
+            _, evicted = _parsed_text_cache.popitem(last=False)
+            _parsed_text_cache_chars -= len(evicted)
+
+
+# Below this much base64 across the pending attachments, parsing serially is faster
+# than shipping the payloads to worker processes and back
+PARALLEL_PARSE_MIN_CHARS = 4_000_000
+
+# One worker pool per process, started on first use and reused across requests
+_parse_executor: Optional[ProcessPoolExecutor] = None
+_parse_executor_unavailable = False
+_parse_executor_lock = threading.Lock()
+
+
+def _parse_mp_context():
+    """Start workers without forking: the server process has live threads (anyio pool,
+    DB pool, log handlers) and a forked child can deadlock on a lock held at fork time
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """Shared attachment-parsing pool, or None where worker processes can't start"""
+    global _parse_executor, _parse_executor_unavailable
+    with _parse_executor_lock:
+        if _parse_executor is None and not _parse_executor_unavailable:
+            try:
+                _parse_executor = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1, mp_context=_parse_mp_context()
+                )
+            except OSError as e:
+                # Some serverless runtimes cannot start worker processes
+                logger.warning(f"Parallel attachment parsing unavailable, parsing serially: {str(e)}")
+                _parse_executor_unavailable = True
+        return _parse_executor
+
+
+def _discard_parse_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next large email starts a fresh one"""
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is executor:
+            _parse_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def _shutdown_parse_executor() -> None:
+    with _parse_executor_lock:
+        executor = _parse_executor
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_attachment(item: Tuple[str, str]) -> Optional[str]:
+    """Parse a single (filename, content_base64) attachment; None if parsing failed"""
+    filename, content_base64 = item
+    try:
+        logger.info(f"Parsing attachment: {filename}")
+        return FileParser.parse_file_bytes(content_base64, filename)
+    except Exception as e:
+        logger.error(f"Error processing attachment {filename}: {str(e)}")
+        return None
+
+
+def iter_attachments(attachments: List[Dict[str, Any]], upload_dir: str) -> Iterator[str]:
+    """Parse all attachments and yield the combined text line block by line block
     
-    for attachment in attachments:
-        try:
-            filename = attachment.get('filename', '')
-            content_base64 = attachment.get('contentBase64', '')
-            
-            if not filename or not content_base64:
-                logger.warning(f"Skipping attachment with missing filename or content: {attachment}")
-                continue
-            
-            logger.info(f"Parsing attachment: {filename}")
-            extracted_text = FileParser.parse_file(content_base64, filename, upload_dir)
-            
-            if extracted_text.strip():
-                all_text.append(f"=== {filename} ===")
-                all_text.append(extracted_text)
-                all_text.append("")  # Add spacing
-            else:
-                logger.info(f"No text extracted from: {filename}")
-                
-        except Exception as e:
-            logger.error(f"Error processing attachment {attachment.get('filename', 'unknown')}: {str(e)}")
+    Yields each file's header, text and a blank spacer in attachment order, so callers
+    can stream the text onward without building one large string.
+    Attachments are parsed in memory; upload_dir is kept for API compatibility.
+    """
+    texts: List[Optional[str]] = [None] * len(attachments)
+    pending = []  # (index, cache key, (filename, content_base64)) for cache misses
+    
+    for index, attachment in enumerate(attachments):
+        filename = attachment.get('filename', '')
+        content_base64 = attachment.get('contentBase64', '')
+        
+        if not filename or not content_base64:
+            logger.warning(f"Skipping attachment with missing filename or content: {attachment}")
             continue
+        
+        key = _attachment_cache_key(filename, content_base64)
+        cached_text = _get_cached_text(key)
+        if cached_text is not None:
+            logger.info(f"Using cached text for attachment: {filename}")
+            texts[index] = cached_text
+        else:
+            pending.append((index, key, (filename, content_base64)))
+    
+    items = [item for _, _, item in pending]
+    
+    results = None
+    if (len(items) > 1 and (os.cpu_count() or 1) > 1
+            and sum(len(content) for _, content in items) >= PARALLEL_PARSE_MIN_CHARS):
+        # Parsing large attachments is CPU-bound, so spread them across processes
+        executor = _get_parse_executor()
+        if executor is not None:
+            try:
+                results = list(executor.map(_parse_attachment, items))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel attachment parsing failed, parsing serially: {str(e)}")
+                _discard_parse_executor(executor)
+    
+    if results is None:
+        results = [_parse_attachment(item) for item in items]
+    
+    for (index, key, _), text in zip(pending, results):
+        if text is not None:
+            _store_cached_text(key, text)
+            texts[index] = text
     
-    return "\n".join(all_text)
+    for attachment, text in zip(attachments, texts):
+        if text is None:
+            continue
+        
+        filename = attachment.get('filename', '')
+        if text.strip():
+            yield f"=== {filename} ==="
+            yield text
+            yield ""  # Add spacing
+        else:
+            logger.info(f"No text extracted from: {filename}")
+
+
+def parse_attachments(attachments: List[Dict[str, Any]], upload_dir: str) -> str:
+    """Parse all attachments and return combined text"""
+    return "\n".join(iter_attachments(attachments, upload_dir))
@@ -1,7 +1,6 @@
 import json
 import logging
 from typing import Dict, Any, Optional
-import google.generativeai as genai
 
 from config import settings
 
@@ -12,12 +11,20 @@ class LLMService:
     """Service for interacting with Google Gemini LLM"""
     
     def __init__(self):
-        self.google_client = None
+        self._google_client = None
+    
+    @property
+    def google_client(self):
+        """Gemini client, created on first use when an API key is configured
         
-        # Initialize Google Gemini client with configured model
-        if settings.gemini_api_key:
+        google.generativeai takes several hundred milliseconds to import, so it is
+        loaded on the first LLM call rather than at application start.
+        """
+        if self._google_client is None and settings.gemini_api_key:
+            import google.generativeai as genai
             genai.configure(api_key=settings.gemini_api_key)
-            self.google_client = genai.GenerativeModel(settings.gemini_model)
+            self._google_client = genai.GenerativeModel(settings.gemini_model)
+        return self._google_client
     
     def extract_insurance_data(self, combined_text: str) -> Dict[str, Any]:
         """Extract structured insurance data from text using Google Gemini"""
@@ -182,7 +189,8 @@ CRITICAL INSTRUCTIONS:
         """Extract data using Google Gemini"""
         try:
             # Configure generation parameters
-            generation_config = genai.types.GenerationConfig(
+            from google.generativeai.types import GenerationConfig
+            generation_config = GenerationConfig(
                 max_output_tokens=settings.max_tokens,
                 temperature=0.1,
             )
@@ -335,7 +343,8 @@ Return ONLY valid JSON with the following structure:
                 risk_flags = []
                 return {"summary": summary, "key_points": key_points[:6], "risk_flags": risk_flags}
 
-            generation_config = genai.types.GenerationConfig(
+            from google.generativeai.types import GenerationConfig
+            generation_config = GenerationConfig(
                 max_output_tokens=min(getattr(settings, "max_tokens", 512), 768),
                 temperature=0.2,
             )
@@ -4,7 +4,7 @@ from typing import List
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import or_
 from datetime import datetime
 import uuid
@@ -13,6 +13,7 @@ from pydantic import BaseModel
 from dateutil import parser as date_parser
 from database import get_db, Submission, WorkItem, RiskAssessment, Comment, User, WorkItemHistory, WorkItemStatus, WorkItemPriority, CompanySize, Underwriter, SubmissionMessage, create_tables, SubmissionStatus, SubmissionHistory
 from llm_service import llm_service
+from business_rules import CyberInsuranceValidator, WorkflowEngine, MessageService
 from models import (
     EmailIntakePayload, EmailIntakeResponse, LogicAppsEmailPayload,
     SubmissionResponse, SubmissionConfirmRequest, 
@@ -50,6 +51,28 @@ def _parse_extracted_fields(extracted_fields):
     else:
         return {}
 
+# Common company size variations mapped to CompanySize, keyed by _normalize_company_size
+COMPANY_SIZE_ALIASES = {
+    'small': CompanySize.SMALL,
+    'medium': CompanySize.MEDIUM,
+    'large': CompanySize.LARGE,
+    'enterprise': CompanySize.ENTERPRISE,
+    'startup': CompanySize.SMALL,
+    'sme': CompanySize.MEDIUM,
+    'multinational': CompanySize.ENTERPRISE
+}
+
+def _normalize_company_size(company_size) -> str:
+    """Lowercase key for company size aliases; numbers skip the no-op lower()"""
+    if not company_size:
+        return ""
+    value_type = type(company_size)
+    if value_type is str:
+        return company_size.lower()
+    if value_type is int or value_type is float:
+        return str(company_size)
+    return str(company_size).lower()
+
 # Create FastAPI app
 app = FastAPI(
     title="Underwriting Workbench API",
@@ -204,7 +227,10 @@ def get_workitems(
     since: datetime = None,
     db: Session = Depends(get_db)
 ):
-    query = db.query(Submission)
+    # Only the columns SubmissionOut needs; skip the large text/JSON payloads
+    query = db.query(Submission).options(
+        load_only(Submission.id, Submission.subject, Submission.created_at, Submission.status)
+    )
 
     if since_id is not None:
         query = query.filter(Submission.id > since_id)
@@ -405,8 +431,6 @@ async def email_intake(
         )
         
         # Apply business rules and validation
-        from business_rules import CyberInsuranceValidator, WorkflowEngine
-        
         # Run comprehensive validation
         validation_status, missing_fields, rejection_reason = CyberInsuranceValidator.validate_submission(extracted_data or {})
         
@@ -439,16 +463,7 @@ async def email_intake(
                     work_item.company_size = CompanySize(company_size)
                 except ValueError:
                     # Try mapping common variations
-                    size_mapping = {
-                        'small': CompanySize.SMALL,
-                        'medium': CompanySize.MEDIUM,
-                        'large': CompanySize.LARGE,
-                        'enterprise': CompanySize.ENTERPRISE,
-                        'startup': CompanySize.SMALL,
-                        'sme': CompanySize.MEDIUM,
-                        'multinational': CompanySize.ENTERPRISE
-                    }
-                    work_item.company_size = size_mapping.get(str(company_size).lower() if company_size else "")
+                    work_item.company_size = COMPANY_SIZE_ALIASES.get(_normalize_company_size(company_size))
         
         # Apply validation results to work item
         if validation_status == "Complete":
@@ -694,8 +709,6 @@ async def logic_apps_email_intake(
         db.refresh(submission)
         
         # Apply business rules and validation (same as regular email intake)
-        from business_rules import CyberInsuranceValidator, WorkflowEngine
-        
         # Run comprehensive validation
         validation_status, missing_fields, rejection_reason = CyberInsuranceValidator.validate_submission(extracted_data or {})
         
@@ -739,18 +752,8 @@ async def logic_apps_email_intake(
                 try:
                     work_item.company_size = CompanySize(str(company_size_raw))
                 except ValueError:
-                    # Try mapping common variations with safe string conversion
-                    size_mapping = {
-                        'small': CompanySize.SMALL,
-                        'medium': CompanySize.MEDIUM,
-                        'large': CompanySize.LARGE,
-                        'enterprise': CompanySize.ENTERPRISE,
-                        'startup': CompanySize.SMALL,
-                        'sme': CompanySize.MEDIUM,
-                        'multinational': CompanySize.ENTERPRISE
-                    }
-                    company_size_str = str(company_size_raw).lower() if company_size_raw else ""
-                    work_item.company_size = size_mapping.get(company_size_str)
+                    # Try mapping common variations
+                    work_item.company_size = COMPANY_SIZE_ALIASES.get(_normalize_company_size(company_size_raw))
         
         # Apply validation results to work item
         if validation_status == "Complete":
@@ -1004,7 +1007,6 @@ async def update_work_item_status(
     db: Session = Depends(get_db)
 ):
     """Update work item status with business rule validation"""
-    from business_rules import WorkflowEngine, MessageService
     
     try:
         # Get the work item
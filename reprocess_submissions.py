@@ -9,6 +9,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from database import SessionLocal, Submission, WorkItem, WorkItemStatus, WorkItemPriority, CompanySize
 from business_rules import CyberInsuranceValidator
+from sqlalchemy.orm import defer
 from datetime import datetime
 import json
 
@@ -21,7 +22,12 @@ def reprocess_existing_submissions():
     db = SessionLocal()
     try:
         # Get submissions without work items (except our test submission)
-        submissions = db.query(Submission).filter(
+        # Defer extracted_fields so it is only fetched for submissions we actually reprocess
+        submissions = db.query(Submission).options(
+            defer(Submission.extracted_fields),
+            defer(Submission.attachment_content),
+            defer(Submission.body_text)
+        ).filter(
             Submission.subject != "Test Cyber Insurance Submission - Simulated"
         ).all()
         
@@ -8,6 +8,7 @@ import sys
 sys.path.append('.')
 
 import json
+import traceback
 from datetime import datetime
 from database import create_tables, get_db, Submission, WorkItem, GuidewireResponse, WorkItemStatus, WorkItemPriority, CompanySize
 from models import WorkItemStatusEnum, WorkItemPriorityEnum, CompanySizeEnum
@@ -289,7 +290,6 @@ def test_complete_guidewire_workflow():
         
     except Exception as e:
         print(f"   ❌ Workflow test failed: {str(e)}")
-        import traceback
         traceback.print_exc()
         return False
     
@@ -352,5 +352,4 @@ if __name__ == "__main__":
             
     except Exception as e:
         print(f"\n❌ TEST SUITE FAILED: {str(e)}")
-        import traceback
         traceback.print_exc()
\ No newline at end of file
@@ -8,6 +8,7 @@ import sys
 sys.path.append('.')
 
 import json
+import traceback
 from guidewire_client import GuidewireClient
 from database import get_db, Submission, WorkItem
 
@@ -137,7 +138,6 @@ def test_with_comprehensive_data():
             
         except Exception as e:
             print(f"❌ Mapping error: {str(e)}")
-            import traceback
             traceback.print_exc()
         
         # Test composite request generation
@@ -155,7 +155,6 @@ def test_with_comprehensive_data():
             
     except Exception as e:
         print(f"❌ Test error: {str(e)}")
-        import traceback
         traceback.print_exc()
     finally:
         db.close()
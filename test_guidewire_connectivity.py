@@ -8,6 +8,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import json
+import traceback
 from guidewire_client import GuidewireClient, GuidewireConfig
 from database import SessionLocal, WorkItem
 import logging
@@ -214,33 +215,32 @@ def main():
         # Test 4: Authentication scenarios
         test_results["authentication"] = test_authentication_scenarios()
         
-        # Summary
-        print("\n" + "=" * 80)
-        print("📊 TEST SUMMARY")
-        print("=" * 80)
-        
+        # Summary, collected and written once
         passed = sum(test_results.values())
         total = len(test_results)
         
+        report = ["\n" + "=" * 80, "📊 TEST SUMMARY", "=" * 80]
         for test_name, result in test_results.items():
             status = "✅ PASS" if result else "❌ FAIL"
-            print(f"   {test_name.replace('_', ' ').title()}: {status}")
+            report.append(f"   {test_name.replace('_', ' ').title()}: {status}")
         
-        print(f"\nOverall: {passed}/{total} tests passed")
+        report.append(f"\nOverall: {passed}/{total} tests passed")
         
         if test_results["basic_connectivity"]:
-            print("\n🎉 Basic connectivity is working! You can proceed with integration.")
+            report.append("\n🎉 Basic connectivity is working! You can proceed with integration.")
         else:
-            print("\n⚠️ Connectivity issues detected. Check network/credentials.")
+            report.append("\n⚠️ Connectivity issues detected. Check network/credentials.")
         
-        print("\n💡 Next steps:")
-        print("   1. Configure proper authentication credentials")
-        print("   2. Test with real Guidewire data")
-        print("   3. Implement full submission workflow")
+        report.extend([
+            "\n💡 Next steps:",
+            "   1. Configure proper authentication credentials",
+            "   2. Test with real Guidewire data",
+            "   3. Implement full submission workflow",
+        ])
+        sys.stdout.write("\n".join(report) + "\n")
         
     except Exception as e:
         print(f"\n❌ Test suite failed with error: {str(e)}")
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ import sys
 sys.path.append('.')
 
 import json
+import traceback
 from datetime import datetime
 from guidewire_client import GuidewireClient
 from database import get_db, Submission, WorkItem
@@ -109,7 +110,6 @@ def test_policy_center_submission_flow():
         
     except Exception as e:
         print(f"❌ Error generating API requests: {str(e)}")
-        import traceback
         traceback.print_exc()
         return False
     